@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Cerberus Dashboard - log line hot path.
+
+Everything that runs once per log line lives here, fully type-annotated
+so the module compiles unchanged with mypyc (or Cython in pure-Python
+mode) for a native-extension speedup:
+
+    mypyc deploy/dashboard_parse.py
+
+Python prefers the resulting .so over this file in the same directory,
+so the compiled build drops in with no import changes.
+"""
+
+import itertools
+import re
+import time
+from typing import Dict, Iterator, NamedTuple, Optional, Set, Tuple
+
+
+class LogEntry(NamedTuple):
+    """One parsed log line.
+
+    Fixed-layout tuple instead of a per-line dict: tailers allocate
+    thousands of these per second and a NamedTuple is roughly a third
+    the size with no hash-table churn.
+    """
+
+    time: str
+    level: str
+    source: str
+    message: str
+
+
+# syslog priority -> dashboard log level (emerg..err / warning / notice,
+# info / debug).
+PRIORITY_LEVELS: Dict[int, str] = {
+    0: "error", 1: "error", 2: "error", 3: "error",
+    4: "warning",
+    5: "info", 6: "info",
+    7: "debug",
+}
+
+# Traffic counters shared by all tailer threads. next() on an
+# itertools.count is a single C-level bump that cannot lose increments
+# across GIL release points the way an unsynchronized dict += can.
+_STAT_COUNTERS: Dict[str, "Iterator[int]"] = {
+    "requests": itertools.count(),
+    "blocked": itertools.count(),
+    "captchas": itertools.count(),
+}
+
+# Precompiled scanners for the per-line hot path: one case-insensitive
+# pass each instead of a .lower() copy plus a chain of substring checks.
+# Group names double as the level string / stats key.
+_LEVEL_RE = re.compile(
+    r"(?P<error>error|failed|fatal)|(?P<warning>warn)|(?P<debug>debug|trace)",
+    re.IGNORECASE,
+)
+_STAT_RE = re.compile(
+    r"(?P<requests>request)|(?P<blocked>blocked|denied|reject)|(?P<captchas>captcha)",
+    re.IGNORECASE,
+)
+_TS_RE = re.compile(r"(\d{2}:\d{2}:\d{2})")
+
+
+# Formatted wall clock cached per second: lines arriving within the
+# same second share one strftime instead of paying datetime.now() plus
+# format-string parsing each.
+_TS_CACHE: Tuple[int, str] = (0, "")
+
+
+def now_hms() -> str:
+    """Current wall-clock time as HH:MM:SS, cached at second granularity."""
+    global _TS_CACHE
+    now_s = int(time.time())
+    if now_s != _TS_CACHE[0]:
+        _TS_CACHE = (now_s, time.strftime("%H:%M:%S", time.localtime(now_s)))
+    return _TS_CACHE[1]
+
+
+def get_stats() -> Dict[str, int]:
+    """Snapshot the counter totals without consuming them."""
+    # count.__reduce__() exposes the next value without advancing it.
+    return {key: c.__reduce__()[1][0] for key, c in _STAT_COUNTERS.items()}
+
+
+def update_stats(line: str) -> None:
+    """Bump the traffic counters for one log line."""
+    seen: Set[str] = set()
+    for match in _STAT_RE.finditer(line):
+        seen.add(match.lastgroup or "")
+    for key in seen:
+        counter = _STAT_COUNTERS.get(key)
+        if counter is not None:
+            next(counter)
+
+
+def parse_log_line(line: str, source: str) -> Optional[LogEntry]:
+    """Turn a raw log line into a dashboard log entry."""
+    # Only trim the line terminator; leading whitespace can be
+    # meaningful in some log formats.
+    line = line.rstrip("\r\n")
+    if not line.strip():
+        return None
+
+    match = _LEVEL_RE.search(line)
+    level = (match.lastgroup or "info") if match else "info"
+
+    update_stats(line)
+
+    match = _TS_RE.search(line)
+    timestamp = match.group(1) if match else now_hms()
+
+    return LogEntry(timestamp, level, source, line)
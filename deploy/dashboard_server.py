@@ -6,17 +6,579 @@ Serves dashboard and provides status API.
 
 import http.server
 import socketserver
+import collections
+import ctypes
+import gzip
+import itertools
 import json
+import mimetypes
+import select
+import selectors
+import struct
 import subprocess
+import threading
 import os
 import time
+from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
+# Per-line hot path; lives in its own module so it can be compiled with
+# mypyc (the .so takes import precedence when present).
+from dashboard_parse import (
+    LogEntry,
+    PRIORITY_LEVELS,
+    get_stats,
+    now_hms,
+    parse_log_line,
+    update_stats,
+)
+
+# libsystemd sd-journal bindings (python3-systemd); falls back to
+# journalctl subprocess tailing when unavailable.
+try:
+    from systemd import journal as systemd_journal
+except ImportError:
+    systemd_journal = None
+
+# dbus-python (python3-dbus), usually present on systemd hosts; lets us
+# ask systemd for unit states over one persistent connection instead of
+# fork+exec'ing systemctl.
+try:
+    import dbus
+except ImportError:
+    dbus = None
+
+# orjson serializes several times faster than stdlib json and returns
+# bytes directly; worth using when present, never worth requiring.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def _dumps(data):
+        """Serialize to compact JSON bytes for an SSE frame."""
+        return orjson.dumps(data)
+else:
+    def _dumps(data):
+        """Serialize to compact JSON bytes for an SSE frame."""
+        return json.dumps(data, ensure_ascii=True,
+                          separators=(",", ":")).encode()
+
 PORT = 9999
 DASHBOARD_DIR = Path(__file__).parent / "dashboard"
 START_TIME = time.time()
 
+SERVICES = ["fortify", "tor", "haproxy", "nginx", "redis-server"]
+NGINX_ACCESS_LOG = "/var/log/nginx/access.log"
+
+# In-memory asset cache built at startup: url path -> (raw bytes,
+# gzipped bytes, mimetype, etag). The dashboard is a handful of small
+# text files, so serving from RAM beats a disk read per poll and gzip
+# shrinks the bytes on the wire 5-10x.
+_ASSETS = {}
+
+
+def load_assets():
+    """Pre-read and pre-compress the dashboard files into memory."""
+    for asset in DASHBOARD_DIR.rglob("*"):
+        if not asset.is_file():
+            continue
+        raw = asset.read_bytes()
+        stat = asset.stat()
+        url_path = "/" + asset.relative_to(DASHBOARD_DIR).as_posix()
+        _ASSETS[url_path] = (
+            raw,
+            gzip.compress(raw, 6),
+            mimetypes.guess_type(str(asset))[0] or "application/octet-stream",
+            f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+        )
+
+# Ring buffer of recent log entries. deque with maxlen gives atomic
+# append-with-drop-oldest under the GIL: one C call per line, no lock,
+# no queue.Full to raise and catch when the ring is at capacity. The
+# per-subscriber buffers below get the same semantics from their maxlen.
+LOG_QUEUE = collections.deque(maxlen=1000)
+
+# Live SSE fan-out: each subscriber owns a bounded (deque, Event) pair,
+# so a slow client only drops its own oldest entries instead of stalling
+# producers or starving other subscribers.
+SUBSCRIBERS = set()
+SUBSCRIBERS_LOCK = threading.Lock()
+SUBSCRIBER_BUFFER = 256
+
+# Per-subscriber coalescing window: after a wakeup the stream handler
+# waits this long for the rest of the burst, then flushes everything in
+# one write. Caps SSE writes at ~1/window per client no matter how
+# bursty the producers get; invisible to a human watching the feed.
+SSE_COALESCE_SECS = 0.1
+
+# Immutable snapshot rebuilt only on connection churn. Producers read
+# the current tuple reference — an atomic load under the GIL — so the
+# enqueue side never takes a lock per line; only subscribe/unsubscribe
+# touch SUBSCRIBERS_LOCK. Same producer/consumer separation a two-lock
+# queue buys, with the dequeue side already lock-free per deque.
+_SUBSCRIBER_SNAPSHOT = ()
+
+
+def _subscribe(sub):
+    """Add an SSE subscriber and refresh the producer snapshot."""
+    global _SUBSCRIBER_SNAPSHOT
+    with SUBSCRIBERS_LOCK:
+        SUBSCRIBERS.add(sub)
+        _SUBSCRIBER_SNAPSHOT = tuple(SUBSCRIBERS)
+
+
+def _unsubscribe(sub):
+    """Remove an SSE subscriber and refresh the producer snapshot."""
+    global _SUBSCRIBER_SNAPSHOT
+    with SUBSCRIBERS_LOCK:
+        SUBSCRIBERS.discard(sub)
+        _SUBSCRIBER_SNAPSHOT = tuple(SUBSCRIBERS)
+
+
+class Subscriber:
+    """One SSE client's bounded buffer and wakeup event."""
+
+    __slots__ = ("buffer", "event")
+
+    def __init__(self):
+        self.buffer = collections.deque(maxlen=SUBSCRIBER_BUFFER)
+        self.event = threading.Event()
+
+
+# Service-status TTL cache: dashboard polls collapse to at most one
+# systemctl probe per window instead of a fork+exec per request.
+STATUS_TTL = 1.5
+_STATUS_CACHE = {"at": 0.0, "data": None}
+_STATUS_LOCK = threading.Lock()
+
+# Persistent system-bus connection and cached unit object paths,
+# established lazily on the first status query.
+_SYSTEMD_BUS = {"bus": None, "units": {}}
+
+
+def _dbus_service_states():
+    """Query ActiveState for every service over one D-Bus connection."""
+    bus = _SYSTEMD_BUS["bus"]
+    if bus is None:
+        bus = dbus.SystemBus()
+        _SYSTEMD_BUS["bus"] = bus
+        _SYSTEMD_BUS["units"] = {}
+    manager = dbus.Interface(
+        bus.get_object("org.freedesktop.systemd1", "/org/freedesktop/systemd1"),
+        "org.freedesktop.systemd1.Manager")
+
+    services = {}
+    for svc in SERVICES:
+        svc_name = svc.replace("-server", "")
+        try:
+            unit_path = _SYSTEMD_BUS["units"].get(svc)
+            if unit_path is None:
+                unit_path = manager.LoadUnit(f"{svc}.service")
+                _SYSTEMD_BUS["units"][svc] = unit_path
+            props = dbus.Interface(
+                bus.get_object("org.freedesktop.systemd1", unit_path),
+                "org.freedesktop.DBus.Properties")
+            state = str(props.Get("org.freedesktop.systemd1.Unit", "ActiveState"))
+            services[svc_name] = "running" if state == "active" else "stopped"
+        except Exception:
+            services[svc_name] = "error"
+    return services
+
+
+def _systemctl_service_states():
+    """Fallback probe via one batched systemctl call."""
+    services = {}
+    try:
+        # systemctl accepts multiple units and prints one state per
+        # line in argument order, so all probes cost a single fork.
+        result = subprocess.run(
+            ["systemctl", "is-active"] + SERVICES,
+            capture_output=True,
+            text=True,
+            timeout=2
+        )
+        states = result.stdout.splitlines()
+        for svc, state in zip(SERVICES, states):
+            svc_name = svc.replace("-server", "")
+            services[svc_name] = "running" if state.strip() == "active" else "stopped"
+        for svc in SERVICES[len(states):]:
+            services[svc.replace("-server", "")] = "error"
+    except subprocess.TimeoutExpired:
+        for svc in SERVICES:
+            services.setdefault(svc.replace("-server", ""), "timeout")
+    except Exception:
+        for svc in SERVICES:
+            services.setdefault(svc.replace("-server", ""), "error")
+    return services
+
+
+def get_service_status():
+    """Return the state of every service, TTL-cached."""
+    with _STATUS_LOCK:
+        if (_STATUS_CACHE["data"] is not None
+                and time.monotonic() - _STATUS_CACHE["at"] < STATUS_TTL):
+            return _STATUS_CACHE["data"]
+
+        services = None
+        if dbus is not None:
+            try:
+                services = _dbus_service_states()
+            except Exception:
+                # Drop the connection; reconnect on the next probe.
+                _SYSTEMD_BUS["bus"] = None
+        if services is None:
+            services = _systemctl_service_states()
+
+        _STATUS_CACHE["data"] = services
+        _STATUS_CACHE["at"] = time.monotonic()
+        return services
+
+
+def publish_log(entry):
+    """Push an entry onto the history ring and fan out to subscribers.
+
+    The SSE frame is serialized exactly once here; subscribers receive
+    the same bytes object, so per-client cost is a plain write no matter
+    how many clients are connected.
+    """
+    LOG_QUEUE.append(entry)
+    # JSON escaping keeps control characters out of the payload: a bare
+    # \r or \n inside the data: field would break SSE framing.
+    payload = _dumps(entry._asdict())
+    assert b"\r" not in payload and b"\n" not in payload
+    frame = b"data: " + payload + b"\n\n"
+    for sub in _SUBSCRIBER_SNAPSHOT:
+        sub.buffer.append(frame)
+        sub.event.set()
+
+
+_UNIT_TO_SOURCE = {f"{svc}.service": svc.replace("-server", "")
+                   for svc in SERVICES}
+
+
+def _publish_journal_entry(message, unit, level, timestamp):
+    """Common tail end for both journal record flavours."""
+    message = message.rstrip("\r\n")
+    if not message.strip():
+        return
+    source = _UNIT_TO_SOURCE.get(unit, "system")
+    update_stats(message)
+    publish_log(LogEntry(timestamp or now_hms(), level, source, message))
+
+
+def _journal_source(sel):
+    """Register the sd-journal reader with the collector selector.
+
+    Reads structured fields straight from libsystemd — no subprocesses,
+    no pipe I/O, and PRIORITY maps directly to a level without scanning
+    the message text.
+    """
+    reader = systemd_journal.Reader()
+    reader.log_level(systemd_journal.LOG_DEBUG)
+    for svc in SERVICES:
+        reader.add_match(_SYSTEMD_UNIT=f"{svc}.service")
+    reader.seek_tail()
+    reader.get_previous()
+
+    def on_ready():
+        if reader.process() != systemd_journal.APPEND:
+            return
+        for record in reader:
+            stamp = record.get("__REALTIME_TIMESTAMP")
+            _publish_journal_entry(
+                record.get("MESSAGE", ""),
+                record.get("_SYSTEMD_UNIT", ""),
+                PRIORITY_LEVELS.get(record.get("PRIORITY"), "info"),
+                stamp.strftime("%H:%M:%S") if stamp else None)
+
+    sel.register(reader.fileno(), selectors.EVENT_READ, on_ready)
+
+
+def _publish_journalctl_line(line):
+    """Publish one journalctl -o json record."""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return
+    message = record.get("MESSAGE", "")
+    if isinstance(message, list):
+        # journald emits non-UTF-8 payloads as byte arrays.
+        message = bytes(message).decode("utf-8", "replace")
+    try:
+        level = PRIORITY_LEVELS.get(int(record["PRIORITY"]), "info")
+    except (KeyError, TypeError, ValueError):
+        level = "info"
+    stamp = record.get("__REALTIME_TIMESTAMP")
+    timestamp = (
+        datetime.fromtimestamp(int(stamp) / 1e6).strftime("%H:%M:%S")
+        if stamp else None)
+    _publish_journal_entry(
+        message, record.get("_SYSTEMD_UNIT", ""), level, timestamp)
+
+
+def _journalctl_source(sel):
+    """Spawn one merged journalctl process and register its pipe.
+
+    Fallback for hosts without the sd-journal bindings: journalctl
+    accepts multiple -u flags and tags each JSON record with its unit,
+    so one process and one pipe cover all services, and the structured
+    fields replace any text-level parsing.
+    """
+    cmd = ["journalctl"]
+    for svc in SERVICES:
+        cmd += ["-u", f"{svc}.service"]
+    cmd += ["-f", "-n", "0", "--no-pager", "-o", "json",
+            "--output-fields=MESSAGE,_SYSTEMD_UNIT,PRIORITY"]
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    fd = proc.stdout.fileno()
+    os.set_blocking(fd, False)
+    pending = [b""]
+
+    def on_ready():
+        while True:
+            try:
+                chunk = os.read(fd, 65536)
+            except BlockingIOError:
+                return
+            if not chunk:
+                raise OSError("journalctl exited")
+            buf = pending[0] + chunk
+            while b"\n" in buf:
+                line, buf = buf.split(b"\n", 1)
+                _publish_journalctl_line(line)
+            pending[0] = buf
+
+    sel.register(proc.stdout, selectors.EVENT_READ, on_ready)
+    return proc
+
+
+# inotify event masks (linux/inotify.h); watched via raw libc calls so
+# the script stays dependency-free.
+_IN_MODIFY = 0x00000002
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_INOTIFY_EVENT_SIZE = 16  # struct inotify_event header, name excluded
+
+
+def _drain_lines(f, source):
+    """Publish every line currently readable from an open log file."""
+    while True:
+        line = f.readline()
+        if not line:
+            break
+        entry = parse_log_line(line, source)
+        if entry:
+            publish_log(entry)
+
+
+def _inotify_init():
+    """Return (libc, fd) for a fresh inotify instance, or None."""
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    return libc, fd
+
+
+def _file_source(sel, filepath, source, position):
+    """Register an inotify-backed watch for a plain log file.
+
+    Raises OSError when the file cannot be watched yet (caller retries)
+    and from the ready callback on rotation (caller reopens). `position`
+    is a {"ino", "pos"} dict carried across rebuilds: reopening the same
+    inode resumes at the recorded offset so a teardown unrelated to this
+    file never re-publishes lines already streamed; a new inode (the
+    rotated-in replacement) is read from the start, and the very first
+    open skips to the end.
+    """
+    ino = _inotify_init()
+    if ino is None:
+        raise OSError("inotify unavailable")
+    libc, fd = ino
+    try:
+        wd = libc.inotify_add_watch(
+            fd, os.fsencode(filepath),
+            _IN_MODIFY | _IN_MOVE_SELF | _IN_DELETE_SELF)
+        if wd < 0:
+            raise OSError(f"cannot watch {filepath}")
+        # errors="replace": one undecodable byte (or a torn read ending
+        # mid multi-byte character) must not wedge the tailer.
+        f = open(filepath, "r", errors="replace")
+    except Exception:
+        os.close(fd)
+        raise
+    stat = os.fstat(f.fileno())
+    if position["ino"] is None:
+        f.seek(0, 2)
+    elif position["ino"] == stat.st_ino and position["pos"] <= stat.st_size:
+        f.seek(position["pos"])
+    # else: rotated or truncated — read from offset 0.
+    position["ino"] = stat.st_ino
+    position["pos"] = f.tell()
+
+    def on_ready():
+        events = os.read(fd, 4096)
+        _drain_lines(f, source)
+        position["pos"] = f.tell()
+        offset = 0
+        while offset + _INOTIFY_EVENT_SIZE <= len(events):
+            _, mask, _, name_len = struct.unpack_from("iIII", events, offset)
+            if mask & (_IN_MOVE_SELF | _IN_DELETE_SELF):
+                raise OSError(f"{filepath} rotated")
+            offset += _INOTIFY_EVENT_SIZE + name_len
+
+    sel.register(fd, selectors.EVENT_READ, on_ready)
+    # Catch up on anything written before the watch existed.
+    _drain_lines(f, source)
+    position["pos"] = f.tell()
+    return fd, f
+
+
+def _tail_file_inotify(f, filepath, source):
+    """Block on kernel inotify wakeups instead of a 100 ms poll loop.
+
+    Returns False if inotify is unavailable (caller falls back to
+    polling) and True when the file was rotated away (caller reopens).
+    """
+    ino = _inotify_init()
+    if ino is None:
+        return False
+    libc, fd = ino
+    try:
+        wd = libc.inotify_add_watch(
+            fd, os.fsencode(filepath),
+            _IN_MODIFY | _IN_MOVE_SELF | _IN_DELETE_SELF)
+        if wd < 0:
+            return False
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        # Catch up on anything written before the watch existed.
+        _drain_lines(f, source)
+        while True:
+            if poller.poll(30000):
+                events = os.read(fd, 4096)
+                _drain_lines(f, source)
+                offset = 0
+                while offset + _INOTIFY_EVENT_SIZE <= len(events):
+                    _, mask, _, name_len = struct.unpack_from("iIII", events, offset)
+                    if mask & (_IN_MOVE_SELF | _IN_DELETE_SELF):
+                        return True
+                    offset += _INOTIFY_EVENT_SIZE + name_len
+            else:
+                # Safety net for anything missed while the buffer was full.
+                _drain_lines(f, source)
+    finally:
+        os.close(fd)
+
+
+def _tail_file_poll(f, source):
+    """Fallback 100 ms poll loop when inotify is unavailable."""
+    while True:
+        line = f.readline()
+        if not line:
+            time.sleep(0.1)
+            continue
+        entry = parse_log_line(line, source)
+        if entry:
+            publish_log(entry)
+
+
+def tail_file(filepath, source):
+    """Follow a plain log file and feed entries into the ring."""
+    skip_existing = True
+    while True:
+        try:
+            with open(filepath, "r", errors="replace") as f:
+                if skip_existing:
+                    f.seek(0, 2)
+                # A rotated-in replacement is all new content: read it
+                # from the start on reopen.
+                skip_existing = False
+                if not _tail_file_inotify(f, filepath, source):
+                    _tail_file_poll(f, source)
+        except Exception:
+            pass
+        time.sleep(5)
+
+
+def run_collectors(watch_files):
+    """Fan in every log source through one selector-driven thread.
+
+    The journal (sd-journal fd or the merged journalctl pipe) and the
+    nginx access log's inotify fd all sit in one DefaultSelector, so a
+    single thread services whichever source is ready. A regular file
+    cannot be polled by epoll, which is why the inotify fd stands in
+    for the log file itself.
+    """
+    # Access-log read position, carried across rebuilds so only a
+    # rotated-in replacement file is ever read from the start.
+    position = {"ino": None, "pos": 0}
+    while True:
+        sel = selectors.DefaultSelector()
+        proc = None
+        file_state = None
+        next_file_retry = 0.0
+        try:
+            if systemd_journal is not None:
+                _journal_source(sel)
+            else:
+                proc = _journalctl_source(sel)
+            while True:
+                if (watch_files and file_state is None
+                        and time.monotonic() >= next_file_retry):
+                    try:
+                        file_state = _file_source(
+                            sel, NGINX_ACCESS_LOG, "nginx", position)
+                    except OSError:
+                        next_file_retry = time.monotonic() + 5.0
+                for key, _ in sel.select(timeout=1.0):
+                    key.data()
+        except Exception as e:
+            print(f"[{now_hms()}] log collector restarting: {e}")
+        finally:
+            sel.close()
+            if proc is not None:
+                proc.kill()
+            if file_state is not None:
+                fd, f = file_state
+                os.close(fd)
+                f.close()
+        time.sleep(5)
+
+
+def start_log_collectors():
+    """Start the multiplexed collector (plus a poll fallback if needed)."""
+    ino = _inotify_init()
+    if ino is None:
+        # No inotify on this platform: the access log keeps its own
+        # poll-loop thread and the selector handles just the journal.
+        threading.Thread(
+            target=tail_file, args=(NGINX_ACCESS_LOG, "nginx"), daemon=True
+        ).start()
+    else:
+        os.close(ino[1])
+    threading.Thread(
+        target=run_collectors, args=(ino is not None,), daemon=True
+    ).start()
+
+
+def get_log_history(limit=100):
+    """Return the most recent log entries from the ring as dicts."""
+    start = max(0, len(LOG_QUEUE) - limit)
+    return [entry._asdict()
+            for entry in itertools.islice(LOG_QUEUE, start, None)]
+
 class DashboardHandler(http.server.SimpleHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=str(DASHBOARD_DIR), **kwargs)
@@ -31,31 +593,77 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
             self.handle_status()
         elif path == "/api/logs/stream":
             self.handle_log_stream()
+        elif path == "/api/logs/history":
+            self.handle_log_history()
         else:
-            if path == "/":
-                self.path = "/index.html"
-            super().do_GET()
+            self.serve_static(path)
+
+    def serve_static(self, path):
+        """Serve a dashboard file from the in-memory cache, or zero-copy
+        from disk with ETag revalidation when uncached."""
+        if path == "/":
+            path = "/index.html"
+
+        asset = _ASSETS.get(path)
+        if asset:
+            raw, gz, ctype, etag = asset
+            use_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+            if use_gzip:
+                # Distinct validator per variant so a shared cache can
+                # never 304-confirm the wrong body.
+                etag = etag[:-1] + '-gz"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Vary", "Accept-Encoding")
+                self.end_headers()
+                return
+            body = gz if use_gzip else raw
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "public, max-age=300")
+            self.send_header("Vary", "Accept-Encoding")
+            if use_gzip:
+                self.send_header("Content-Encoding", "gzip")
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        target = (DASHBOARD_DIR / path.lstrip("/")).resolve()
+        try:
+            target.relative_to(DASHBOARD_DIR.resolve())
+            f = open(target, "rb")
+        except (ValueError, OSError):
+            self.send_error(404, "File not found")
+            return
+        with f:
+            stat = os.fstat(f.fileno())
+            etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            ctype = mimetypes.guess_type(str(target))[0] or "application/octet-stream"
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(stat.st_size))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            try:
+                # sendfile(2): kernel copies file -> socket directly,
+                # no user-space buffer shuffling.
+                self.connection.sendfile(f)
+            except OSError:
+                pass
     
     def handle_status(self):
         """Get service status."""
         try:
-            services = {}
-            for svc in ["fortify", "tor", "haproxy", "nginx", "redis-server"]:
-                try:
-                    result = subprocess.run(
-                        ["systemctl", "is-active", svc],
-                        capture_output=True, 
-                        text=True, 
-                        timeout=2
-                    )
-                    status = result.stdout.strip()
-                    svc_name = svc.replace("-server", "")
-                    services[svc_name] = "running" if status == "active" else "stopped"
-                except subprocess.TimeoutExpired:
-                    services[svc.replace("-server", "")] = "timeout"
-                except Exception as e:
-                    services[svc.replace("-server", "")] = "error"
-            
+            services = get_service_status()
+
             # Get onion addresses - try multiple locations
             mirror_onion = None
             for path in ["/etc/cerberus/onion_hostname", "/var/lib/tor/cerberus_hs/hostname"]:
@@ -70,7 +678,7 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
                 "services": services,
                 "mirror_onion": mirror_onion,
                 "backend_onion": "sigilahzwq5u34gdh2bl3ymokyc7kobika55kyhztsucdoub73hz7qid.onion",
-                "stats": {"requests": 0, "blocked": 0, "captchas": 0},
+                "stats": get_stats(),
                 "start_time": START_TIME * 1000
             }
             
@@ -86,6 +694,19 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
             self.end_headers()
             self.wfile.write(json.dumps({"error": str(e)}).encode())
     
+    def handle_log_history(self):
+        """Return recent log entries as JSON."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(json.dumps({"logs": get_log_history()}).encode())
+
+    def send_sse(self, data):
+        """Write one SSE frame to the client."""
+        self.wfile.write(b"data: " + _dumps(data) + b"\n\n")
+        self.wfile.flush()
+
     def handle_log_stream(self):
         """Stream logs via SSE."""
         self.send_response(200)
@@ -94,37 +715,62 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
         self.send_header("Connection", "keep-alive")
         self.send_header("Access-Control-Allow-Origin", "*")
         self.end_headers()
-        
-        # Send initial message
-        msg = {
-            "time": time.strftime("%H:%M:%S"),
+
+        self.send_sse({
+            "time": now_hms(),
             "level": "info",
             "source": "dashboard",
             "message": "Connected to log stream"
-        }
-        self.wfile.write(f"data: {json.dumps(msg)}\n\n".encode())
-        self.wfile.flush()
-        
-        # Keep connection alive with periodic updates
+        })
+
+        # Register a private bounded buffer; producers fan out into it
+        # and overflow drops our oldest entries, never theirs.
+        sub = Subscriber()
+        _subscribe(sub)
+
+        idle = 0.0
         try:
             while True:
-                time.sleep(5)
-                msg = {
-                    "time": time.strftime("%H:%M:%S"),
-                    "level": "debug",
-                    "source": "dashboard", 
-                    "message": "Heartbeat"
-                }
-                self.wfile.write(f"data: {json.dumps(msg)}\n\n".encode())
-                self.wfile.flush()
+                if sub.event.wait(timeout=1.0):
+                    # Let the rest of a burst land before flushing, then
+                    # drain everything pending into one write/flush pair:
+                    # one syscall and one TCP segment per burst instead
+                    # of per frame.
+                    time.sleep(SSE_COALESCE_SECS)
+                    sub.event.clear()
+                    frames = []
+                    while sub.buffer:
+                        frames.append(sub.buffer.popleft())
+                    if frames:
+                        self.wfile.write(b"".join(frames))
+                        self.wfile.flush()
+                    idle = 0.0
+                else:
+                    idle += 1.0
+                    if idle >= 15:
+                        self.wfile.write(b": keepalive\n\n")
+                        self.wfile.flush()
+                        idle = 0.0
         except:
             pass
+        finally:
+            _unsubscribe(sub)
 
 
 class ThreadedHTTPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
     allow_reuse_address = True
     daemon_threads = True
 
+    def server_activate(self):
+        # SSE clients hold a thread each for the connection lifetime;
+        # a small stack keeps hundreds of subscribers cheap instead of
+        # reserving the 8 MiB default per thread.
+        try:
+            threading.stack_size(256 * 1024)
+        except (ValueError, RuntimeError):
+            pass
+        super().server_activate()
+
 
 def main():
     print(f"\n🔱 Cerberus Dashboard Server")
@@ -141,7 +787,10 @@ def main():
         return
     
     print(f"Serving from: {DASHBOARD_DIR}")
-    
+
+    load_assets()
+    start_log_collectors()
+
     try:
         with ThreadedHTTPServer(("", PORT), DashboardHandler) as httpd:
             print(f"Server started on port {PORT}")